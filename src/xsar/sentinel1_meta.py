@@ -9,12 +9,11 @@ import pandas as pd
 import geopandas as gpd
 import rasterio
 from rasterio.control import GroundControlPoint
-from scipy.interpolate import RectBivariateSpline, interp1d
 from shapely.geometry import Polygon
 from shapely.ops import unary_union
 import shapely
 from shapely.geometry import box
-from .utils import to_lon180, haversine, timing, class_or_instancemethod
+from .utils import to_lon180, haversine, bearing, timing, class_or_instancemethod
 from .raster_readers import available_rasters
 from . import sentinel1_xml_mappings
 from .xml_parser import XmlParser
@@ -22,12 +21,103 @@ from affine import Affine
 import os
 from datetime import datetime
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from .ipython_backends import repr_mimebundle
 
 logger = logging.getLogger('xsar.sentinel1_meta')
 logger.addHandler(logging.NullHandler())
 
 
+@lru_cache(maxsize=32)
+def _transformer_from_lonlat(crs):
+    # pyproj.Transformer creation is slow, so transformers are cached by crs
+    import pyproj
+    return pyproj.Transformer.from_crs(pyproj.CRS('EPSG:4326'), crs, always_xy=True)
+
+
+def _read_shapefile_feature(path, bounds):
+    """
+    Read geometries from shapefile `path` that intersect lon/lat `bounds`, as a cartopy feature.
+
+    See Also
+    --------
+    _load_shapefile_feature: cached version, for local files.
+    """
+    # we get the crs from the shapefile to be able to transform the bounds to this crs_in
+    # (so we can use `mask=` in gpd.read_file)
+    import fiona
+    import pyproj
+    from shapely.ops import transform
+    with fiona.open(path) as fshp:
+        try:
+            # proj6 give a " FutureWarning: '+init=<authority>:<code>' syntax is deprecated.
+            # '<authority>:<code>' is the preferred initialization method"
+            crs_in = fshp.crs['init']
+        except KeyError:
+            crs_in = fshp.crs
+        crs_in = pyproj.CRS(crs_in)
+    bounds_crs = transform(_transformer_from_lonlat(crs_in).transform, box(*bounds))
+
+    with warnings.catch_warnings():
+        # ignore "RuntimeWarning: Sequential read of iterator was interrupted. Resetting iterator."
+        warnings.simplefilter("ignore", RuntimeWarning)
+        feature = cartopy.feature.ShapelyFeature(
+            gpd.read_file(path, mask=bounds_crs).to_crs(epsg=4326).geometry,
+            cartopy.crs.PlateCarree()
+        )
+    return feature
+
+
+@lru_cache(maxsize=8)
+def _load_shapefile_feature(path, mtime, bounds):
+    """
+    Cached `_read_shapefile_feature`, so a shapefile is read once for several Sentinel1Meta objects
+    with nearby footprints.
+
+    `mtime` is the modification time of the local file `path`, only used as a cache key, so the cache is
+    invalidated if the shapefile changes. Each cached entry keeps its geometries in memory (a few MB for
+    coastlines), so the cache size is kept small.
+    """
+    return _read_shapefile_feature(path, bounds)
+
+
+def _compute_burst_indices(geoloc_line, shape_atrack, burst_nlines):
+    """
+    Indices of the bursts start in the geolocation grid, for each atrack of the image.
+
+    Parameters
+    ----------
+    geoloc_line: np.ndarray
+        sorted atracks of the geolocation grid
+    shape_atrack: int
+        image size along atrack
+    burst_nlines: int
+        number of lines per burst
+
+    Returns
+    -------
+    ind: np.ndarray
+        for each atrack in `range(shape_atrack)`, index in `geoloc_line` of the first line of the atrack burst
+        (clipped to `geoloc_line` size)
+    geoloc_iburst: np.ndarray
+        burst number of each `geoloc_line`
+    """
+    burst_nlines = int(burst_nlines)
+    # find the indice of the bursts in the geolocation grid
+    geoloc_iburst = np.floor(geoloc_line / float(burst_nlines)).astype('int32')
+    # geoloc_iburst is sorted, so the first geoloc index of burst k is the count of geoloc lines in bursts < k
+    # (same as np.searchsorted(geoloc_iburst, k, side='left'))
+    n_bursts = (shape_atrack - 1) // burst_nlines + 1
+    counts = np.bincount(geoloc_iburst, minlength=n_bursts)[:n_bursts]
+    first_index_of_burst = np.cumsum(counts) - counts
+    # security check for unrealistic atrack_values exceeding the image extent
+    first_index_of_burst = np.minimum(first_index_of_burst, len(geoloc_line) - 1)
+    # expand to the high resolution grid (atrack // burst_nlines is a step function)
+    ind = np.repeat(first_index_of_burst, burst_nlines)[:shape_atrack]
+    return ind, geoloc_iburst
+
+
 class Sentinel1Meta:
     """
     Handle dataset metadata.
@@ -59,9 +149,7 @@ class Sentinel1Meta:
     path = None
     product = None
     manifest = None
-    subdatasets = None
     dsid = None
-    manifest_attrs = None
 
     @timing
     def __init__(self, name, _xml_parser=None):
@@ -99,13 +187,14 @@ class Sentinel1Meta:
             self.product = "XXX"
         """Product type, like 'GRDH', 'SLC', etc .."""
         self.manifest = os.path.join(self.path, 'manifest.safe')
-        self.manifest_attrs = self.xml_parser.get_compound_var(self.manifest, 'safe_attributes')
+        self._manifest_attrs = None
+        self._manifest_files = None
         self._safe_files = None
         self.multidataset = False
         """True if multi dataset"""
-        self.subdatasets = gpd.GeoDataFrame(geometry=[], index=[])
-        """Subdatasets as GeodataFrame (empty if single dataset)"""
-        datasets_names = list(self.safe_files['dsid'].sort_index().unique())
+        self._subdatasets = None
+        # dataset names don't need polarizations order, so safe_files (and manifest_attrs) are not loaded here
+        datasets_names = list(self._get_manifest_files()['dsid'].sort_index().unique())
         if self.name.endswith(':') and len(datasets_names) == 1:
             self.name = datasets_names[0]
         self.dsid = self.name.split(':')[-1]
@@ -115,19 +204,33 @@ class Sentinel1Meta:
         self._submeta = []
         if self.short_name.endswith(':'):
             self.short_name = self.short_name + self.dsid
-        if self.files.empty:
+        if self.name not in datasets_names:
+            # no files for self.name: self.files would be empty
             try:
-                self.subdatasets = gpd.GeoDataFrame(geometry=self.manifest_attrs['footprints'], index=datasets_names)
+                self._subdatasets = gpd.GeoDataFrame(geometry=self.manifest_attrs['footprints'], index=datasets_names)
             except ValueError:
                 # not as many footprints than subdatasets count. (probably TOPS product)
-                self._submeta = [ Sentinel1Meta(subds) for subds in datasets_names ]
-                sub_footprints = [ submeta.footprint for submeta in self._submeta ]
-                self.subdatasets = gpd.GeoDataFrame(geometry=sub_footprints, index=datasets_names)
+                # submetas share self.xml_parser (so the manifest is parsed only once),
+                # and annotations files are read concurrently to get footprints.
+                with ThreadPoolExecutor(max_workers=len(datasets_names)) as executor:
+                    self._submeta = list(executor.map(
+                        lambda subds: Sentinel1Meta(subds, _xml_parser=self.xml_parser), datasets_names))
+                    sub_footprints = list(executor.map(lambda submeta: submeta.footprint, self._submeta))
+                self._subdatasets = gpd.GeoDataFrame(geometry=sub_footprints, index=datasets_names)
             self.multidataset = True
 
-        self.platform = self.manifest_attrs['mission'] + self.manifest_attrs['satellite']
-        """Mission platform"""
         self._time_range = None
+        self._orbit = None
+        self._image = None
+        self._azimuth_fmrate = None
+        self._denoised = None
+        self._bursts_cache = None
+        self._doppler_estimate_cache = None
+        self._indices_bursts_cache = None
+        self._burst_azitime_cache = None
+        self._geoloc_midrange_azitime_cache = None
+        self._geoloc_line_cache = None
+        self._azi_time_step_ns_cache = None
         self._mask_features_raw = {}
         self._mask_features = {}
         self._mask_intersecting_geometries = {}
@@ -137,8 +240,14 @@ class Sentinel1Meta:
         for name, feature in self.__class__._mask_features_raw.items():
             self.set_mask_feature(name, feature)
         self._geoloc = None
-        self.rasters = self.__class__.rasters.copy()
+        self._footprint = None
+        self._cross_antemeridian = None
+        self._coords2ll_grid_cache = None
+        self._ll2coords_grid_cache = None
+        self._inv_approx_transform_cache = None
+        self.rasters = self.__class__.rasters
         """pandas dataframe for rasters (see `xsar.Sentinel1Meta.set_raster`)"""
+        self._rasters_owned = False
 
     def __del__(self):
         logger.debug('__del__')
@@ -156,8 +265,15 @@ class Sentinel1Meta:
         -------
         bool
         """
-        return name == self.name or name in self.subdatasets.index
+        return name == self.name or (self.multidataset and name in self.subdatasets.index)
 
+    @property
+    def subdatasets(self):
+        """Subdatasets as GeodataFrame (empty if single dataset)"""
+        if self._subdatasets is None:
+            # single dataset: the empty GeoDataFrame is only built if requested
+            self._subdatasets = gpd.GeoDataFrame(geometry=[], index=[])
+        return self._subdatasets
 
     def _get_time_range(self):
         if self.multidataset:
@@ -187,6 +303,18 @@ class Sentinel1Meta:
                 raise KeyError('Unable to find key/attr "%s" in Sentinel1Meta' % k)
         return res_dict
 
+    @property
+    def manifest_attrs(self):
+        """dict of attributes read from the manifest (swath type, polarizations, footprints, etc ...)"""
+        if self._manifest_attrs is None:
+            self._manifest_attrs = self.xml_parser.get_compound_var(self.manifest, 'safe_attributes')
+        return self._manifest_attrs
+
+    @property
+    def platform(self):
+        """Mission platform"""
+        return self.manifest_attrs['mission'] + self.manifest_attrs['satellite']
+
     @property
     def orbit_pass(self):
         """
@@ -241,21 +369,33 @@ class Sentinel1Meta:
 
         """
         if self._safe_files is None:
-            files = self.xml_parser.get_compound_var(self.manifest, 'files')
-            # add path
-            for f in ['annotation', 'measurement', 'noise', 'calibration']:
-                files[f] = files[f].map(lambda f: os.path.join(self.path, f))
-
+            files = self._get_manifest_files().copy()
             # set "polarization" as a category, so sorting dataframe on polarization
             # will return the dataframe in same order as self._safe_attributes['polarizations']
-            files["polarization"] = files.polarization.astype('category').cat.reorder_categories(
-                self.manifest_attrs['polarizations'], ordered=True)
-            # replace 'dsid' with full path, compatible with gdal sentinel1 driver
-            files['dsid'] = files['dsid'].map(lambda dsid: "SENTINEL1_DS:%s:%s" % (self.path, dsid))
+            files['polarization'] = pd.Categorical(
+                files['polarization'], categories=self.manifest_attrs['polarizations'], ordered=True)
+            if files['polarization'].isna().any():
+                # pd.Categorical silently set unknown polarizations to NaN
+                raise ValueError('Polarizations %s not in manifest polarizations %s' % (
+                    list(self._get_manifest_files()['polarization'][files['polarization'].isna()].unique()),
+                    self.manifest_attrs['polarizations']))
             files.sort_values('polarization', inplace=True)
             self._safe_files = files
         return self._safe_files
 
+    def _get_manifest_files(self):
+        # files from manifest, with full paths, but not sorted by polarization (cached)
+        if self._manifest_files is None:
+            files = self.xml_parser.get_compound_var(self.manifest, 'files')
+            # add path (vectorized string concatenation)
+            prefix = os.path.join(self.path, '')
+            cols = ['annotation', 'measurement', 'noise', 'calibration']
+            files[cols] = prefix + files[cols]
+            # replace 'dsid' with full path, compatible with gdal sentinel1 driver
+            files['dsid'] = 'SENTINEL1_DS:%s:' % self.path + files['dsid']
+            self._manifest_files = files
+        return self._manifest_files
+
     @property
     def files(self):
         """
@@ -271,9 +411,12 @@ class Sentinel1Meta:
     @property
     def footprint(self):
         """footprint, as a shapely polygon or multi polygon"""
-        if self.multidataset:
-            return unary_union(self._footprints)
-        return self.geoloc.attrs['footprint']
+        if self._footprint is None:
+            if self.multidataset:
+                self._footprint = unary_union(self._footprints)
+            else:
+                self._footprint = self.geoloc.attrs['footprint']
+        return self._footprint
 
     @property
     def geometry(self):
@@ -294,22 +437,21 @@ class Sentinel1Meta:
             for var_name in ['longitude', 'latitude', 'altitude', 'azimuth_time', 'slant_range_time', 'incidence',
                              'elevation']:
                 # TODO: we should use dask.array.from_delayed so xml files are read on demand
-                da_var = self.xml_parser.get_compound_var(xml_annotation, var_name)
+                da_var, history = self.xml_parser.get_compound_var(xml_annotation, var_name, with_history=True)
                 da_var.name = var_name
-                da_var.attrs['history'] = self.xml_parser.get_compound_var(self.files['annotation'].iloc[0],
-                                                                           var_name,
-                                                                           describe=True)
+                da_var.attrs['history'] = history
                 da_var_list.append(da_var)
 
             self._geoloc = xr.merge(da_var_list)
 
             self._geoloc.attrs = {}
             # compute attributes (footprint, coverage, pixel_size)
+            # corners (atrack, xtrack) indexes are [(0, 0), (0, -1), (-1, -1), (-1, 0)]
+            corners_atrack = [0, 0, -1, -1]
+            corners_xtrack = [0, -1, -1, 0]
             footprint_dict = {}
             for ll in ['longitude', 'latitude']:
-                footprint_dict[ll] = [
-                    self._geoloc[ll].isel(atrack=a, xtrack=x).values for a, x in [(0, 0), (0, -1), (-1, -1), (-1, 0)]
-                ]
+                footprint_dict[ll] = self._geoloc[ll].values[corners_atrack, corners_xtrack].tolist()
             corners = list(zip(footprint_dict['longitude'], footprint_dict['latitude']))
             p = Polygon(corners)
             self._geoloc.attrs['footprint'] = p
@@ -324,19 +466,15 @@ class Sentinel1Meta:
             
             # compute self._geoloc.attrs['approx_transform'], from gcps
             # we need to convert self._geoloc to  a list of GroundControlPoint
-            def _to_rio_gcp(pt_geoloc):
-                # convert a point from self._geoloc grid to rasterio GroundControlPoint
-                return GroundControlPoint(
-                    x=pt_geoloc.longitude.item(),
-                    y=pt_geoloc.latitude.item(),
-                    z=pt_geoloc.altitude.item(),
-                    col=pt_geoloc.atrack.item(),
-                    row=pt_geoloc.xtrack.item()
-                )
-
+            # (values are extracted once, as python lists, to avoid xarray indexing for each gcp)
+            lons = self._geoloc.longitude.values.tolist()
+            lats = self._geoloc.latitude.values.tolist()
+            alts = self._geoloc.altitude.values.tolist()
+            atracks = self._geoloc.atrack.values.tolist()
+            xtracks = self._geoloc.xtrack.values.tolist()
             gcps = [
-                _to_rio_gcp(self._geoloc.sel(atrack=atrack, xtrack=xtrack))
-                for atrack in  self._geoloc.atrack for xtrack in self._geoloc.xtrack
+                GroundControlPoint(x=lons[i][j], y=lats[i][j], z=alts[i][j], col=atrack, row=xtrack)
+                for i, atrack in enumerate(atracks) for j, xtrack in enumerate(xtracks)
             ]
             # approx transform, from all gcps (inaccurate)
             self._geoloc.attrs['approx_transform'] = rasterio.transform.from_gcps(gcps)
@@ -430,8 +568,12 @@ class Sentinel1Meta:
             return descr
 
         if self._mask_geometry[name] is None:
-            poly = self._get_mask_intersecting_geometries(name) \
-                .unary_union.intersection(self.footprint)
+            gseries = self._get_mask_intersecting_geometries(name)
+            footprint = self.footprint
+            # intersect only geometries selected by the spatial index, and union the (small) intersections.
+            # (same as gseries.unary_union.intersection(footprint), without the union of the whole mask)
+            gseries = gseries.iloc[gseries.sindex.query(footprint, predicate='intersects')]
+            poly = gseries.intersection(footprint).unary_union
 
             if poly.is_empty:
                 poly = Polygon()
@@ -454,29 +596,16 @@ class Sentinel1Meta:
             feature = self._mask_features_raw[name]
             if isinstance(feature, str):
                 # feature is a shapefile.
-                # we get the crs from the shapefile to be able to transform the footprint to this crs_in
-                # (so we can use `mask=` in gpd.read_file)
-                import fiona
-                import pyproj
-                from shapely.ops import transform
-                with fiona.open(feature) as fshp:
-                    try:
-                        # proj6 give a " FutureWarning: '+init=<authority>:<code>' syntax is deprecated.
-                        # '<authority>:<code>' is the preferred initialization method"
-                        crs_in = fshp.crs['init']
-                    except KeyError:
-                        crs_in = fshp.crs
-                    crs_in = pyproj.CRS(crs_in)
-                proj_transform = pyproj.Transformer.from_crs(pyproj.CRS('EPSG:4326'), crs_in, always_xy=True).transform
-                footprint_crs = transform(proj_transform, self.footprint)
-
-                with warnings.catch_warnings():
-                    # ignore "RuntimeWarning: Sequential read of iterator was interrupted. Resetting iterator."
-                    warnings.simplefilter("ignore", RuntimeWarning)
-                    feature = cartopy.feature.ShapelyFeature(
-                        gpd.read_file(feature, mask=footprint_crs).to_crs(epsg=4326).geometry,
-                        cartopy.crs.PlateCarree()
-                    )
+                # footprint bounds are rounded outward to 1 degree, so nearby footprints share the cached feature
+                minx, miny, maxx, maxy = self.footprint.bounds
+                bounds = (float(np.floor(minx)), float(np.floor(miny)), float(np.ceil(maxx)), float(np.ceil(maxy)))
+                try:
+                    mtime = os.path.getmtime(feature)
+                except OSError:
+                    # not a local file (but readable by fiona): changes can't be detected, so it's not cached
+                    feature = _read_shapefile_feature(feature, bounds)
+                else:
+                    feature = _load_shapefile_feature(feature, mtime, bounds)
             if not isinstance(feature, cartopy.feature.Feature):
                 raise TypeError('Expected a cartopy.feature.Feature type')
             self._mask_features[name] = feature
@@ -488,6 +617,15 @@ class Sentinel1Meta:
         # get defaults if exists
         default = available_rasters.loc[name:name]
 
+        if isinstance(self_or_cls, type):
+            # class level changes are done on a copy, so they are not seen by existing instances
+            self_or_cls.rasters = self_or_cls.rasters.copy()
+        elif not self_or_cls._rasters_owned:
+            # copy on write: instance rasters dataframe is shared (with the class, or another instance)
+            # until it's modified
+            self_or_cls.rasters = self_or_cls.rasters.copy()
+            self_or_cls._rasters_owned = True
+
         # set from params, or from default
         self_or_cls.rasters.loc[name, 'resource'] = resource or default.loc[name, 'resource']
         self_or_cls.rasters.loc[name, 'read_function'] = read_function or default.loc[name, 'read_function']
@@ -542,9 +680,10 @@ class Sentinel1Meta:
         """dict with pol as key, and bool as values (True is DN is predenoised at L1 level)"""
         if self.multidataset:
             return None  # not defined for multidataset
-        else:
-            return dict(
+        if self._denoised is None:
+            self._denoised = dict(
                 [self.xml_parser.get_compound_var(f, 'denoised') for f in self.files['annotation']])
+        return self._denoised
 
     @property
     def ipf(self):
@@ -564,7 +703,10 @@ class Sentinel1Meta:
     @property
     def cross_antemeridian(self):
         """True if footprint cross antemeridian"""
-        return ((np.max(self.geoloc['longitude']) - np.min(self.geoloc['longitude'])) > 180).item()
+        if self._cross_antemeridian is None:
+            lon = self.geoloc['longitude'].values
+            self._cross_antemeridian = bool((np.max(lon) - np.min(lon)) > 180)
+        return self._cross_antemeridian
 
     @property
     def orbit(self):
@@ -586,18 +728,23 @@ class Sentinel1Meta:
         """
         if self.multidataset:
             return None  # not defined for multidataset
-        gdf_orbit = self.xml_parser.get_compound_var(self.files['annotation'].iloc[0], 'orbit')
-        gdf_orbit.attrs['history'] = self.xml_parser.get_compound_var(self.files['annotation'].iloc[0], 'orbit',
-                                                                      describe=True)
-        return gdf_orbit
+        if self._orbit is None:
+            gdf_orbit, history = self.xml_parser.get_compound_var(self.files['annotation'].iloc[0], 'orbit',
+                                                                  with_history=True)
+            gdf_orbit.attrs['history'] = history
+            self._orbit = gdf_orbit
+        return self._orbit
 
     @property
     def image(self):
         if self.multidataset:
             return None
-        img_dict = self.xml_parser.get_compound_var(self.files['annotation'].iloc[0], 'image')
-        img_dict['history'] = self.xml_parser.get_compound_var(self.files['annotation'].iloc[0], 'image', describe=True)
-        return img_dict
+        if self._image is None:
+            img_dict, history = self.xml_parser.get_compound_var(self.files['annotation'].iloc[0], 'image',
+                                                                 with_history=True)
+            img_dict['history'] = history
+            self._image = img_dict
+        return self._image
 
     @property
     def azimuth_fmrate(self):
@@ -605,51 +752,136 @@ class Sentinel1Meta:
         xarray.Dataset
             Frequency Modulation rate annotations such as t0 (azimuth time reference) and polynomial coefficients: Azimuth FM rate = c0 + c1(tSR - t0) + c2(tSR - t0)^2
         """
-        fmrates = self.xml_parser.get_compound_var(self.files['annotation'].iloc[0], 'azimuth_fmrate')
-        fmrates.attrs['history'] = self.xml_parser.get_compound_var(self.files['annotation'].iloc[0], 'azimuth_fmrate',
-                                                                    describe=True)
-        return fmrates
+        if self._azimuth_fmrate is None:
+            fmrates, history = self.xml_parser.get_compound_var(self.files['annotation'].iloc[0], 'azimuth_fmrate',
+                                                                with_history=True)
+            fmrates.attrs['history'] = history
+            self._azimuth_fmrate = fmrates
+        return self._azimuth_fmrate
 
     @property
-    def _dict_coords2ll(self):
+    def _coords2ll_grid(self):
         """
-        dict with keys ['longitude', 'latitude'] with interpolation function (RectBivariateSpline) as values.
+        Geolocation grid for `coords2ll`, as a tuple `(idx_atrack, idx_xtrack, values)`,
+        where `values` is a dict with keys ['longitude', 'latitude'] and 2D np.ndarray values at the grid nodes.
+        (see `Sentinel1Meta._interp_geoloc`).
 
-        Examples:
-        ---------
-            get longitude at atrack=100 and xtrack=200:
-            ```
-            >>> self._dict_coords2ll['longitude'].ev(100,200)
-            array(-66.43947434)
-            ```
         Notes:
         ------
             if self.cross_antemeridian is True, 'longitude' will be in range [0, 360]
+
+            computed once, and cached.
         """
-        resdict = {}
-        geoloc = self.geoloc
-        if self.cross_antemeridian:
-            geoloc['longitude'] = geoloc['longitude'] % 360
+        if self._coords2ll_grid_cache is None:
+            geoloc = self.geoloc
+            values = {}
+            for ll in ['longitude', 'latitude']:
+                values[ll] = geoloc[ll].values
+                if ll == 'longitude' and self.cross_antemeridian:
+                    # don't modify geoloc in place
+                    values[ll] = values[ll] % 360
+            self._coords2ll_grid_cache = (geoloc.atrack.values, geoloc.xtrack.values, values)
+
+        return self._coords2ll_grid_cache
+
+    @property
+    def _ll2coords_grid(self):
+        """
+        Like `Sentinel1Meta._coords2ll_grid`, but `values` has keys ['atrack', 'xtrack'].
+
+        Values at the geolocation grid nodes are `~self.approx_transform * (longitude, latitude)`,
+        so interpolating them is the same as `~self.approx_transform * self.coords2ll(atracks, xtracks)`
+        (used by `ll2coords` to compute the `approx_transform` error).
 
-        idx_xtrack = np.array(geoloc.xtrack)
-        idx_atrack = np.array(geoloc.atrack)
+        Notes:
+        ------
+            Not valid if self.cross_antemeridian is True.
+        """
+        if self._ll2coords_grid_cache is None:
+            geoloc = self.geoloc
+            atrack_identity, xtrack_identity = self._apply_affine(self._inv_approx_transform,
+                                                                 geoloc.longitude.values, geoloc.latitude.values)
+            self._ll2coords_grid_cache = (geoloc.atrack.values, geoloc.xtrack.values,
+                                          {'atrack': atrack_identity, 'xtrack': xtrack_identity})
 
-        for ll in ['longitude', 'latitude']:
-            resdict[ll] = RectBivariateSpline(idx_atrack, idx_xtrack, np.asarray(geoloc[ll]), kx=1, ky=1)
+        return self._ll2coords_grid_cache
 
-        return resdict
+    @staticmethod
+    def _apply_affine(transform, x, y):
+        """
+        Same as `transform * (x, y)`, but vectorized with numpy (`x` and `y` might be arrays, lists or scalars).
+        """
+        x = np.asarray(x)
+        y = np.asarray(y)
+        return transform.c + transform.a * x + transform.b * y, transform.f + transform.d * x + transform.e * y
+
+    @staticmethod
+    def _interp_geoloc(grid, atracks, xtracks, to_grid=False):
+        """
+        Bilinear interpolation of `grid` values (like `self._coords2ll_grid`) at `atracks`, `xtracks`.
+        Out of grid coordinates are clipped, so they take the value at the grid border.
+
+        Grid cells and weights are computed once, and shared by all values.
+
+        Parameters
+        ----------
+        grid: tuple
+            `(idx_atrack, idx_xtrack, values)`, with `idx_atrack` and `idx_xtrack` sorted 1D np.ndarray,
+            and `values` a dict of 2D np.ndarray of shape `(idx_atrack.size, idx_xtrack.size)`
+        atracks: np.ndarray or scalar
+        xtracks: np.ndarray or scalar
+        to_grid: bool
+            If True, `atracks` and `xtracks` must be 1D arrays. The results will be 2D array of shape (atracks.size, xtracks.size).
+
+        Returns
+        -------
+        tuple of np.ndarray
+            one array for each item in `values`, with shape depending on `to_grid` keyword.
+        """
+        idx_atrack, idx_xtrack, values = grid
+
+        def cells(idx, coords):
+            # lower grid node index, and weight of the upper one
+            coords = np.clip(coords, idx[0], idx[-1])
+            i = np.clip(np.searchsorted(idx, coords, side='right') - 1, 0, idx.size - 2)
+            w = (coords - idx[i]) / (idx[i + 1] - idx[i])
+            return i, w
+
+        if not to_grid:
+            atracks, xtracks = np.broadcast_arrays(atracks, xtracks)
+        ia, wa = cells(idx_atrack, atracks)
+        ix, wx = cells(idx_xtrack, xtracks)
+        if to_grid:
+            ia, wa = ia[:, np.newaxis], wa[:, np.newaxis]
+            ix, wx = ix[np.newaxis, :], wx[np.newaxis, :]
+
+        res = []
+        for v in values.values():
+            res.append((v[ia, ix] * (1 - wa) + v[ia + 1, ix] * wa) * (1 - wx)
+                       + (v[ia, ix + 1] * (1 - wa) + v[ia + 1, ix + 1] * wa) * wx)
+        return tuple(res)
 
     def _coords2ll_shapely(self, shape, approx=False):
         if approx:
             (xoff, a, b, yoff, d, e) = self.approx_transform.to_gdal()
             return shapely.affinity.affine_transform(shape, (a, b, d, e, xoff, yoff))
+        elif hasattr(shapely, 'get_coordinates'):
+            # shapely >= 2: convert all vertices at once (`shape` might also be an array of geometries)
+            coords = shapely.get_coordinates(shape)
+            lon, lat = self._coords2ll_array(coords[:, 0], coords[:, 1])
+            return shapely.set_coordinates(copy.copy(shape), np.column_stack([lon, lat]))
         else:
             return shapely.ops.transform(self.coords2ll, shape)
 
     def _ll2coords_shapely(self, shape, approx=False):
         if approx:
-            (xoff, a, b, yoff, d, e) = (~self.approx_transform).to_gdal()
+            (xoff, a, b, yoff, d, e) = self._inv_approx_transform.to_gdal()
             return shapely.affinity.affine_transform(shape, (a, b, d, e, xoff, yoff))
+        elif hasattr(shapely, 'get_coordinates'):
+            # shapely >= 2: convert all vertices at once
+            coords = shapely.get_coordinates(shape)
+            atrack, xtrack = self.ll2coords(coords[:, 0], coords[:, 1])
+            return shapely.set_coordinates(copy.copy(shape), np.column_stack([atrack, xtrack]))
         else:
             return shapely.ops.transform(self.ll2coords, shape)
 
@@ -679,44 +911,49 @@ class Sentinel1Meta:
         """
 
         if isinstance(args[0], shapely.geometry.base.BaseGeometry):
-            return self._coords2ll_shapely(args[0])
+            return self._coords2ll_shapely(args[0], approx=approx)
 
         atracks, xtracks = args
 
-        scalar = True
-        if hasattr(atracks, '__iter__'):
-            scalar = False
+        if isinstance(atracks, (int, float, np.number)) and isinstance(xtracks, (int, float, np.number)):
+            # scalar fast path (also for to_grid, as a 1x1 grid is returned as scalars)
+            lon, lat = self._coords2ll_array(atracks, xtracks, approx=approx)
+            return float(lon), float(lat)
+
+        lon, lat = self._coords2ll_array(np.asarray(atracks), np.asarray(xtracks), to_grid=to_grid, approx=approx)
+
+        if not isinstance(atracks, np.ndarray) and hasattr(atracks, '__iter__'):
+            # same type as input (list, tuple, ...)
+            lon = type(atracks)(lon)
+            lat = type(atracks)(lat)
 
+        return lon, lat
+
+    def _coords2ll_array(self, atracks, xtracks, to_grid=False, approx=False):
+        """
+        Same as `coords2ll`, but only for arrays (or scalars), without any input type dispatch.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            (longitude, latitude)
+        """
         if approx:
             if to_grid:
-                xtracks2D, atracks2D = np.meshgrid(xtracks, atracks)
-                lon, lat = self.approx_transform * (atracks2D, xtracks2D)
-                pass
+                # broadcasting (atracks.size, 1) with (1, xtracks.size): no meshgrid needed
+                lon, lat = self._apply_affine(self.approx_transform,
+                                              np.asarray(atracks)[:, np.newaxis], np.asarray(xtracks)[np.newaxis, :])
             else:
-                lon, lat = self.approx_transform * (atracks, xtracks)
+                lon, lat = self._apply_affine(self.approx_transform, atracks, xtracks)
         else:
-            dict_coords2ll = self._dict_coords2ll
-            if to_grid:
-                lon = dict_coords2ll['longitude'](atracks, xtracks)
-                lat = dict_coords2ll['latitude'](atracks, xtracks)
-            else:
-                lon = dict_coords2ll['longitude'].ev(atracks, xtracks)
-                lat = dict_coords2ll['latitude'].ev(atracks, xtracks)
+            lon, lat = self._interp_geoloc(self._coords2ll_grid, atracks, xtracks, to_grid=to_grid)
 
         if self.cross_antemeridian:
             lon = to_lon180(lon)
 
-        if scalar and hasattr(lon, '__iter__'):
-            lon = lon.item()
-            lat = lat.item()
-
-        if hasattr(lon, '__iter__') and type(lon) is not type(atracks):
-            lon = type(atracks)(lon)
-            lat = type(atracks)(lat)
-
         return lon, lat
 
-    def ll2coords(self, *args):
+    def ll2coords(self, *args, approx=False):
         """
         Get `(atracks, xtracks)` from `(lon, lat)`,
         or convert a lon/lat shapely shapely object to atrack/xtrack coordinates.
@@ -726,6 +963,9 @@ class Sentinel1Meta:
         *args: lon, lat or shapely object
             lon and lat might be iterables or scalars
 
+        approx: bool, default False
+            If True, only use `approx_transform` (fast, but inaccurate).
+
         Returns
         -------
         tuple of np.array or tuple of float (atracks, xtracks) , or a shapely object
@@ -746,16 +986,24 @@ class Sentinel1Meta:
         """
 
         if isinstance(args[0], shapely.geometry.base.BaseGeometry):
-            return self._ll2coords_shapely(args[0])
+            return self._ll2coords_shapely(args[0], approx=approx)
 
         lon, lat = args
 
         # approximation with global inaccurate transform
-        atrack_approx, xtrack_approx = ~self.approx_transform * (np.asarray(lon), np.asarray(lat))
+        atrack_approx, xtrack_approx = self._apply_affine(self._inv_approx_transform, lon, lat)
+
+        if approx:
+            return atrack_approx, xtrack_approx
 
         # Theoretical identity. It should be the same, but the difference show the error.
-        lon_identity, lat_identity = self.coords2ll(atrack_approx, xtrack_approx, to_grid=False)
-        atrack_identity, xtrack_identity = ~self.approx_transform * (lon_identity, lat_identity)
+        if self.cross_antemeridian:
+            lon_identity, lat_identity = self._coords2ll_array(atrack_approx, xtrack_approx)
+            atrack_identity, xtrack_identity = self._apply_affine(self._inv_approx_transform,
+                                                                 lon_identity, lat_identity)
+        else:
+            # same as above, but with approx_transform already applied on the geolocation grid
+            atrack_identity, xtrack_identity = self._interp_geoloc(self._ll2coords_grid, atrack_approx, xtrack_approx)
 
         # we are now able to compute the error, and make a correction
         atrack_error = atrack_identity - atrack_approx
@@ -769,6 +1017,10 @@ class Sentinel1Meta:
         else:
             scalar = True
 
+        if scalar:
+            # 0-d arrays to numpy scalars
+            atrack, xtrack = atrack[()], xtrack[()]
+
         return atrack, xtrack
 
     def coords2heading(self, atracks, xtracks, to_grid=False, approx=True):
@@ -789,23 +1041,32 @@ class Sentinel1Meta:
 
         """
 
-        lon1, lat1 = self.coords2ll(atracks - 1, xtracks, to_grid=to_grid, approx=approx)
-        lon2, lat2 = self.coords2ll(atracks + 1, xtracks, to_grid=to_grid, approx=approx)
-        _, heading = haversine(lon1, lat1, lon2, lat2)
-        return heading
+        # lon/lat at atracks - 1 and atracks + 1 are computed with a single call
+        atracks = np.asarray(atracks)
+        xtracks = np.asarray(xtracks)
+        if to_grid:
+            lon, lat = self._coords2ll_array(np.concatenate([atracks - 1, atracks + 1]), xtracks,
+                                             to_grid=True, approx=approx)
+            lon1, lon2 = lon[:atracks.size], lon[atracks.size:]
+            lat1, lat2 = lat[:atracks.size], lat[atracks.size:]
+        else:
+            atracks, xtracks = np.broadcast_arrays(atracks, xtracks)
+            (lon1, lon2), (lat1, lat2) = self._coords2ll_array(np.stack([atracks - 1, atracks + 1]),
+                                                               np.stack([xtracks, xtracks]), approx=approx)
+        return bearing(lon1, lat1, lon2, lat2)
 
     @property
     def _bursts(self):
-        if self.xml_parser.get_var(self.files['annotation'].iloc[0], 'annotation.number_of_bursts') > 0:
-            bursts = self.xml_parser.get_compound_var(self.files['annotation'].iloc[0], 'bursts')
-            bursts.attrs['history'] = self.xml_parser.get_compound_var(self.files['annotation'].iloc[0], 'bursts',
-                                                                       describe=True)
-            return bursts
-        else:
-            bursts = self.xml_parser.get_compound_var(self.files['annotation'].iloc[0], 'bursts_grd')
-            bursts.attrs['history'] = self.xml_parser.get_compound_var(self.files['annotation'].iloc[0], 'bursts_grd',
-                                                                       describe=True)
-            return bursts
+        if self._bursts_cache is None:
+            if self.xml_parser.get_var(self.files['annotation'].iloc[0], 'annotation.number_of_bursts') > 0:
+                bursts, history = self.xml_parser.get_compound_var(self.files['annotation'].iloc[0], 'bursts',
+                                                                   with_history=True)
+            else:
+                bursts, history = self.xml_parser.get_compound_var(self.files['annotation'].iloc[0], 'bursts_grd',
+                                                                   with_history=True)
+            bursts.attrs['history'] = history
+            self._bursts_cache = bursts
+        return self._bursts_cache
 
     @property
     def approx_transform(self):
@@ -834,6 +1095,13 @@ class Sentinel1Meta:
         """
         return self.geoloc.attrs['approx_transform']
 
+    @property
+    def _inv_approx_transform(self):
+        """`~self.approx_transform`, computed once."""
+        if self._inv_approx_transform_cache is None:
+            self._inv_approx_transform_cache = ~self.approx_transform
+        return self._inv_approx_transform_cache
+
     def __repr__(self):
         if self.multidataset:
             meta_type = "multi (%d)" % len(self.subdatasets)
@@ -855,18 +1123,15 @@ class Sentinel1Meta:
         # return a minimal dictionary that can be used with Sentinel1Meta.from_dict() or pickle (see __reduce__)
         # to reconstruct another instance of self
         #
+        mask_names = self._mask_features_raw.keys()
         minidict = {
             'name': self.name,
             '_mask_features_raw': self._mask_features_raw,
-            '_mask_features': {},
-            '_mask_intersecting_geometries': {},
-            '_mask_geometry': {},
+            '_mask_features': dict.fromkeys(mask_names),
+            '_mask_intersecting_geometries': dict.fromkeys(mask_names),
+            '_mask_geometry': dict.fromkeys(mask_names),
             'rasters': self.rasters
         }
-        for name in minidict['_mask_features_raw'].keys():
-            minidict['_mask_intersecting_geometries'][name] = None
-            minidict['_mask_geometry'][name] = None
-            minidict['_mask_features'][name] = None
         return minidict
 
     @classmethod
@@ -879,6 +1144,8 @@ class Sentinel1Meta:
         minidict = copy.copy(minidict)
         new = cls(minidict['name'])
         new.__dict__.update(minidict)
+        # rasters are shared with the minidict
+        new._rasters_owned = False
         return new
 
     @property
@@ -887,10 +1154,34 @@ class Sentinel1Meta:
         xarray.Dataset
             with Doppler Centroid Estimates from annotations such as geo_polynom,data_polynom or frequency
         """
-        dce = self.xml_parser.get_compound_var(self.files['annotation'].iloc[0], 'doppler_estimate')
-        dce.attrs['history'] = self.xml_parser.get_compound_var(self.files['annotation'].iloc[0], 'doppler_estimate',
-                                                                describe=True)
-        return dce
+        if self._doppler_estimate_cache is None:
+            dce, history = self.xml_parser.get_compound_var(self.files['annotation'].iloc[0], 'doppler_estimate',
+                                                            with_history=True)
+            dce.attrs['history'] = history
+            self._doppler_estimate_cache = dce
+        return self._doppler_estimate_cache
+
+    @property
+    def _azi_time_step_ns(self):
+        """azimuth time interval, as integer nanoseconds (truncated from picoseconds), computed once"""
+        if self._azi_time_step_ns_cache is None:
+            self._azi_time_step_ns_cache = int(self.image['azimuth_time_interval'] * 1e12) // 1000
+        return self._azi_time_step_ns_cache
+
+    @property
+    def _geoloc_line(self):
+        """atrack coordinates of the geolocation grid, as a contiguous numpy array, computed once"""
+        if self._geoloc_line_cache is None:
+            self._geoloc_line_cache = np.ascontiguousarray(self.geoloc['atrack'].values)
+        return self._geoloc_line_cache
+
+    @property
+    def _geoloc_midrange_azitime(self):
+        """azimuth time at the middle of the image from geolocation grid (low resolution), computed once"""
+        if self._geoloc_midrange_azitime_cache is None:
+            n_pixels = int((len(self.geoloc['xtrack']) - 1) / 2)
+            self._geoloc_midrange_azitime_cache = self.geoloc['azimuth_time'].values[:, n_pixels]
+        return self._geoloc_midrange_azitime_cache
 
     def _get_indices_bursts(self):
         """
@@ -903,28 +1194,23 @@ class Sentinel1Meta:
             azimuth time at the middle of the image from geolocation grid (low resolution)
         geoloc_iburst np.array
 
+        Notes
+        -----
+            results are computed once, and cached.
         """
+        if self._indices_bursts_cache is not None:
+            return self._indices_bursts_cache
         ind = None
         geoloc_azitime = None
         geoloc_iburst = None
         geoloc_line = None
         if self.product == 'SLC' and 'WV' not in self.swath:
-            burst_nlines = self._bursts.attrs['atrack_per_burst']
-
-            geoloc_line = self.geoloc['atrack'].values
-            # find the indice of the bursts in the geolocation grid
-            geoloc_iburst = np.floor(geoloc_line / float(burst_nlines)).astype('int32')
-            # find the indices of the bursts in the high resolution grid
-            atrack = np.arange(0, self.image['shape'][0])
-            iburst = np.floor(atrack / float(burst_nlines)).astype('int32')
-            # find the indices of the burst transitions
-            ind = np.searchsorted(geoloc_iburst, iburst, side='left')
-            n_pixels = int((len(self.geoloc['xtrack']) - 1) / 2)
-            geoloc_azitime = self.geoloc['azimuth_time'].values[:, n_pixels]
-            # security check for unrealistic atrack_values exceeding the image extent
-            if ind.max() >= len(geoloc_azitime):
-                ind[ind >= len(geoloc_azitime)] = len(geoloc_azitime) - 1
-        return ind, geoloc_azitime, geoloc_iburst, geoloc_line
+            geoloc_line = self._geoloc_line
+            ind, geoloc_iburst = _compute_burst_indices(geoloc_line, self.image['shape'][0],
+                                                        self._bursts.attrs['atrack_per_burst'])
+            geoloc_azitime = self._geoloc_midrange_azitime
+        self._indices_bursts_cache = ind, geoloc_azitime, geoloc_iburst, geoloc_line
+        return self._indices_bursts_cache
 
     def _burst_azitime(self):
         """
@@ -932,29 +1218,43 @@ class Sentinel1Meta:
 
         Returns
         -------
-        np.ndarray
+        xarray.DataArray
             the high resolution azimuth time vector interpolated at the midle of the subswath
-        """
-        atrack = np.arange(0, self.image['shape'][0])
-        if self.product == 'SLC' and 'WV' not in self.swath:
-            azi_time_int = self.image['azimuth_time_interval']
-            # turn this interval float/seconds into timedelta/picoseconds
-            azi_time_int = np.timedelta64(int(azi_time_int * 1e12), 'ps')
-            ind, geoloc_azitime, geoloc_iburst, geoloc_line = self._get_indices_bursts()
-            # compute the azimuth time by adding a step function (first term) and a growing term (second term)
-            azitime = geoloc_azitime[ind] + (atrack - geoloc_line[ind]) * azi_time_int.astype('<m8[ns]')
-        else:  # GRD* cases
-            n_pixels = int((len(self.geoloc['xtrack']) - 1) / 2)
-            geoloc_azitime = self.geoloc['azimuth_time'].values[:, n_pixels]
-            geoloc_line = self.geoloc['atrack'].values
-            finterp = interp1d(geoloc_line, geoloc_azitime.astype(float))
-            azitime = finterp(atrack)
-            azitime = azitime.astype('<m8[ns]')
-        azitime = xr.DataArray(azitime, coords={'atrack': atrack}, dims=['atrack'],
-                               attrs={
-                                   'description': 'azimuth times interpolated along atrack dimension at the middle of range dimension'})
 
-        return azitime
+        Notes
+        -----
+            result is computed once, and cached.
+        """
+        if self._burst_azitime_cache is None:
+            # int32 is enough for atrack indices (halves the coordinate size)
+            atrack = np.arange(0, self.image['shape'][0], dtype='int32')
+            if self.product == 'SLC' and 'WV' not in self.swath:
+                azitime = self._burst_azitime_slc(atrack)
+            else:  # GRD* cases
+                azitime = self._burst_azitime_grd(atrack)
+            self._burst_azitime_cache = xr.DataArray(
+                azitime, coords={'atrack': atrack}, dims=['atrack'],
+                attrs={
+                    'description': 'azimuth times interpolated along atrack dimension at the middle of range dimension'})
+
+        return self._burst_azitime_cache
+
+    def _burst_azitime_slc(self, atrack):
+        # TOPS SLC: azimuth time as datetime64[ns] np.ndarray at `atrack`, from bursts
+        ind, geoloc_azitime, geoloc_iburst, geoloc_line = self._get_indices_bursts()
+        # compute the azimuth time by adding a step function (first term) and a growing term (second term)
+        # (computed as int64 nanoseconds, to avoid timedelta64 arithmetic)
+        azitime = geoloc_azitime.astype('<M8[ns]').view('i8')[ind]
+        azitime += (atrack - geoloc_line[ind].astype('i8')) * self._azi_time_step_ns
+        return azitime.view('<M8[ns]')
+
+    def _burst_azitime_grd(self, atrack):
+        # GRD* (and WV): azimuth time as datetime64[ns] np.ndarray at `atrack`, interpolated from geoloc
+        geoloc_azitime_ns = self._geoloc_midrange_azitime.astype('<M8[ns]').view('i8')
+        # linear interpolation of nanoseconds, relative to the first time (to keep float precision)
+        azitime = np.interp(atrack, self._geoloc_line.astype(float),
+                            (geoloc_azitime_ns - geoloc_azitime_ns[0]).astype(float))
+        return (azitime.astype('i8') + geoloc_azitime_ns[0]).view('<M8[ns]')
 
     def bursts(self, only_valid_location=True):
         """
@@ -974,37 +1274,33 @@ class Sentinel1Meta:
 
         """
         if self.multidataset:
-            blocks_list = []
             # for subswath in self.subdatasets.index:
-            for submeta in self._submeta:
-                block = submeta.bursts(only_valid_location=only_valid_location)
-                block['subswath'] = submeta.dsid
-                block = block.set_index('subswath', append=True).reorder_levels(['subswath', 'burst'])
-                blocks_list.append(block)
-            blocks = pd.concat(blocks_list)
+            blocks_list = [submeta.bursts(only_valid_location=only_valid_location) for submeta in self._submeta]
+            # 'subswath' index level is added by concat (no per block set_index/reorder_levels)
+            blocks = pd.concat(blocks_list, keys=[submeta.dsid for submeta in self._submeta], names=['subswath'])
         else:
             burst_list = self._bursts
             if burst_list['burst'].size == 0:
                 blocks = gpd.GeoDataFrame()
             else:
-                bursts = []
-                bursts_az_inds = {}
                 inds_burst, geoloc_azitime, geoloc_iburst, geoloc_line = self._get_indices_bursts()
-                for burst_ind, uu in enumerate(np.unique(inds_burst)):
-                    if only_valid_location:
-                        extent = np.copy(burst_list['valid_location'].values[burst_ind, :])
-                        area = box(extent[0], extent[1], extent[2], extent[3])
-
-                    else:
-                        inds_one_val = np.where(inds_burst == uu)[0]
-                        bursts_az_inds[uu] = inds_one_val
-                        area = box(bursts_az_inds[burst_ind][0], 0, bursts_az_inds[burst_ind][-1], self.image['shape'][1])
-                    burst = pd.Series(dict([
-                        ('geometry_image', area)]))
-                    bursts.append(burst)
+                # inds_burst is monotone, so bursts are contiguous atrack ranges [burst_start, burst_stop]
+                burst_start = np.concatenate([[0], np.flatnonzero(np.diff(inds_burst)) + 1])
+                burst_stop = np.concatenate([burst_start[1:], [inds_burst.size]]) - 1
+                n_bursts = burst_start.size
+                if only_valid_location:
+                    extent = burst_list['valid_location'].values[:n_bursts]
+                else:
+                    extent = np.column_stack([burst_start, np.zeros(n_bursts, dtype=int),
+                                              burst_stop, np.full(n_bursts, self.image['shape'][1])])
+                if hasattr(shapely, 'box'):
+                    # shapely >= 2: all boxes at once, and all bursts polygons converted at once
+                    areas = shapely.box(extent[:, 0], extent[:, 1], extent[:, 2], extent[:, 3])
+                    geometry = self._coords2ll_shapely(areas)
+                else:
+                    areas = [box(*e) for e in extent]
+                    geometry = [self.coords2ll(area) for area in areas]
                 # to geopandas
-                blocks = pd.concat(bursts, axis=1).T
-                blocks = gpd.GeoDataFrame(blocks)
-                blocks['geometry'] = blocks['geometry_image'].apply(self.coords2ll)
+                blocks = gpd.GeoDataFrame({'geometry_image': areas, 'geometry': geometry})
                 blocks.index.name = 'burst'
         return blocks
@@ -514,15 +514,20 @@ def bursts(atrack_per_burst, xtrack_per_burst, burst_azimuthTime, burst_azimuthA
         burst_firstValidSample[burst_firstValidSample == -1] = np.nan
         burst_lastValidSample[burst_lastValidSample == -1] = np.nan
         nbursts = len(burst_azimuthTime)
-        valid_locations = np.empty((nbursts, 4), dtype='int32')
-        for ibur in range(nbursts):
-            fvs = burst_firstValidSample[ibur, :]
-            lvs = burst_lastValidSample[ibur, :]
-            # valind = np.where((fvs != -1) | (lvs != -1))[0]
-            valind = np.where(np.isfinite(fvs) | np.isfinite(lvs))[0]
-            valloc = [ibur * atrack_per_burst + valind.min(), fvs[valind].min(),
-                      ibur * atrack_per_burst + valind.max(), lvs[valind].max()]
-            valid_locations[ibur, :] = valloc
+        # valid lines in each burst, and first/last valid line index (computed for all bursts at once)
+        valid = np.isfinite(burst_firstValidSample) | np.isfinite(burst_lastValidSample)
+        no_valid_line = ~valid.any(axis=1)
+        if no_valid_line.any():
+            raise ValueError('No valid line in burst(s) %s' % np.flatnonzero(no_valid_line).tolist())
+        first_line = valid.argmax(axis=1)
+        last_line = valid.shape[1] - 1 - valid[:, ::-1].argmax(axis=1)
+        burst_start = np.arange(nbursts) * atrack_per_burst
+        valid_locations = np.column_stack([
+            burst_start + first_line,
+            np.where(valid, burst_firstValidSample, np.inf).min(axis=1),
+            burst_start + last_line,
+            np.where(valid, burst_lastValidSample, -np.inf).max(axis=1)
+        ]).astype('int32')
         da = xr.Dataset(
             {
                 'azimuthTime': ('burst', burst_azimuthTime),
@@ -128,35 +128,66 @@ def to_lon180(lon):
     return lon
 
 
+def _bearing_rad(lat1, lat2, dlon, cos_lat1, cos_lat2):
+    # bearing in radians, from radians inputs (cosines are given, so they can be shared with the distance)
+    return np.arctan2(np.sin(dlon) * cos_lat2, cos_lat1 * np.sin(lat2) - np.sin(lat1) * cos_lat2 * np.cos(dlon))
+
+
 def haversine(lon1, lat1, lon2, lat2):
     """
     Compute distance in meters, and bearing in degrees from point1 to point2, assuming spherical earth.
 
     Parameters
     ----------
-    lon1: float
-    lat1: float
-    lon2: float
-    lat2: float
+    lon1: float or array_like
+    lat1: float or array_like
+    lon2: float or array_like
+    lat2: float or array_like
 
     Returns
     -------
-    tuple(float, float)
+    tuple(float, float) or tuple(np.ndarray, np.ndarray)
         distance in meters, and bearing in degrees
 
     """
     # convert decimal degrees to radians
     lon1, lat1, lon2, lat2 = map(np.radians, [lon1, lat1, lon2, lat2])
 
-    # haversine formula
+    # terms shared by distance and bearing
     dlon = lon2 - lon1
     dlat = lat2 - lat1
-    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    cos_lat1 = np.cos(lat1)
+    cos_lat2 = np.cos(lat2)
+
+    # haversine formula
+    a = np.sin(dlat / 2) ** 2 + cos_lat1 * cos_lat2 * np.sin(dlon / 2) ** 2
     c = 2 * np.arcsin(np.sqrt(a))
     r = 6371000  # Radius of earth in meters.
-    bearing = np.arctan2(np.sin(lon2 - lon1) * np.cos(lat2),
-                         np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(lon2 - lon1))
-    return c * r, np.rad2deg(bearing)
+    return c * r, np.rad2deg(_bearing_rad(lat1, lat2, dlon, cos_lat1, cos_lat2))
+
+
+def bearing(lon1, lat1, lon2, lat2):
+    """
+    Compute bearing in degrees from point1 to point2, assuming spherical earth.
+    Same as `haversine(lon1, lat1, lon2, lat2)[1]`, without computing the distance.
+
+    Parameters
+    ----------
+    lon1: float or array_like
+    lat1: float or array_like
+    lon2: float or array_like
+    lat2: float or array_like
+
+    Returns
+    -------
+    float or np.ndarray
+        bearing in degrees
+
+    """
+    # convert decimal degrees to radians
+    lon1, lat1, lon2, lat2 = map(np.radians, [lon1, lat1, lon2, lat2])
+
+    return np.rad2deg(_bearing_rad(lat1, lat2, lon2 - lon1, np.cos(lat1), np.cos(lat2)))
 
 
 def minigrid(x, y, z, method='linear', dims=['x', 'y']):
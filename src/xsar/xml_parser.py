@@ -1,6 +1,8 @@
-from lxml import objectify
+from lxml import objectify, etree
 import jmespath
 import logging
+import threading
+from collections import OrderedDict
 from collections.abc import Iterable
 import os
 import re
@@ -33,29 +35,97 @@ class XmlParser:
     namespaces: dict
         xml namespaces, passed to lxml.xpath.
         namespaces are mutualised between all handled xml files.
+
+    Notes
+    -----
+    Parsed xml files (up to `xml_roots_cache_size`) and compiled xpaths are cached,
+    so several variables read from the same file don't parse it again.
     """
 
+    xml_roots_cache_size = 8
+
     def __init__(self, xpath_mappings={}, compounds_vars={}, namespaces={}):
         self._namespaces = namespaces
         self._xpath_mappings = xpath_mappings
         self._compounds_vars = compounds_vars
+        self._init_caches()
+
+    def _init_caches(self):
+        # parsed xml roots, by xml filename (lru)
+        self._xml_roots = OrderedDict()
+        # compiled xpath, by xpath string
+        self._compiled_xpaths = {}
+        self._lock = threading.RLock()
+
+    def __getstate__(self):
+        # caches are not serializable (lxml objects and lock)
+        state = self.__dict__.copy()
+        for key in ['_xml_roots', '_compiled_xpaths', '_lock']:
+            del state[key]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_caches()
 
     def __del__(self):
         logger.debug('__del__ XmlParser')
 
     def getroot(self, xml_file):
         """return xml root object from xml_file. (also update self._namespaces with fetched ones)"""
+        with self._lock:
+            xml_root = self._xml_roots.get(xml_file)
+            if xml_root is not None:
+                self._xml_roots.move_to_end(xml_file)
+                return xml_root
+
         xml_root = objectify.parse(xml_file).getroot()
-        self._namespaces.update(xml_root.nsmap)
+        with self._lock:
+            if any(self._namespaces.get(prefix) != uri for prefix, uri in xml_root.nsmap.items()):
+                self._namespaces.update(xml_root.nsmap)
+                # compiled xpaths are bound to namespaces
+                self._compiled_xpaths.clear()
+            self._xml_roots[xml_file] = xml_root
+            while len(self._xml_roots) > self.xml_roots_cache_size:
+                self._xml_roots.popitem(last=False)
         return xml_root
 
     def xpath(self, xml_file, path):
         """
-        get path from xml_file. this is a simple wrapper for `objectify.parse(xml_file).getroot().xpath(path)`
+        get path from xml_file. this is a simple wrapper for `objectify.parse(xml_file).getroot().xpath(path)`,
+        using cached xml root and compiled xpath.
         """
 
         xml_root = self.getroot(xml_file)
-        result = [getattr(e, 'pyval', e) for e in xml_root.xpath(path, namespaces=self._namespaces)]
+        with self._lock:
+            compiled_xpath = self._compiled_xpaths.get(path)
+            if compiled_xpath is None:
+                compiled_xpath = etree.XPath(path, namespaces=self._namespaces)
+                self._compiled_xpaths[path] = compiled_xpath
+            result = [getattr(e, 'pyval', e) for e in compiled_xpath(xml_root)]
+        return result
+
+    def _get_mapping(self, jpath):
+        """return `(func, xpath)` for jmespath `jpath` in xpath_mappings. (`func` is None if no decoder)"""
+        func = None
+        xpath = jmespath.search(jpath, self._xpath_mappings)
+        if xpath is None:
+            raise KeyError('jmespath "%s" not found in xpath_mappings' % jpath)
+
+        if isinstance(xpath, tuple) and callable(xpath[0]):
+            func, xpath = xpath
+
+        return func, xpath
+
+    def _eval_mapping(self, xml_file, func, xpath):
+        """evaluate `xpath` in `xml_file`, and decode it with `func`"""
+        if not isinstance(xpath, str):
+            raise NotImplementedError('Non leaf xpath of type "%s" instead of str' % type(xpath).__name__)
+
+        result = self.xpath(xml_file, xpath)
+        if func is not None:
+            result = func(result)
+
         return result
 
     def get_var(self, xml_file, jpath, describe=False):
@@ -77,27 +147,14 @@ class XmlParser:
             xpath list, or decoded object, if a conversion function was specified in xpath_mappings
         """
 
-        func = None
-        xpath = jmespath.search(jpath, self._xpath_mappings)
-        if xpath is None:
-            raise KeyError('jmespath "%s" not found in xpath_mappings' % jpath)
-
-        if isinstance(xpath, tuple) and callable(xpath[0]):
-            func, xpath = xpath
+        func, xpath = self._get_mapping(jpath)
 
         if describe:
             return xpath
 
-        if not isinstance(xpath, str):
-            raise NotImplementedError('Non leaf xpath of type "%s" instead of str' % type(xpath).__name__)
-
-        result = self.xpath(xml_file, xpath)
-        if func is not None:
-            result = func(result)
-
-        return result
+        return self._eval_mapping(xml_file, func, xpath)
 
-    def get_compound_var(self, xml_file, var_name, describe=False):
+    def get_compound_var(self, xml_file, var_name, describe=False, with_history=False):
         """
 
         Parameters
@@ -114,7 +171,10 @@ class XmlParser:
 
             If True, only returns a string describing the variable (file, xpath, etc...)
 
+        with_history: bool
 
+            If True, returns a tuple `(object, description)`, where description is the string returned with `describe=True`.
+            xpath_mappings are only resolved once for both.
 
         Returns
         -------
@@ -122,12 +182,6 @@ class XmlParser:
 
         """
 
-        if describe:
-            # keep only informative parts in filename
-            # sub SAFE path
-            minifile = re.sub('.*SAFE/', '', xml_file)
-            minifile = re.sub(r'-.*\.xml', '.xml', minifile)
-
         var_object = self._compounds_vars[var_name]
 
         func = None
@@ -140,28 +194,45 @@ class XmlParser:
         else:
             args = var_object
 
-        result = None
+        # (func, xpath) for each jmespath in args
+        mappings = None
         if isinstance(args, dict):
-            result = {}
-            for key, path in args.items():
-                result[key] = self.get_var(xml_file, path, describe=describe)
+            mappings = {key: self._get_mapping(path) for key, path in args.items()}
         elif isinstance(args, Iterable):
-            result = [self.get_var(xml_file, p, describe=describe) for p in args]
+            mappings = [self._get_mapping(p) for p in args]
+
+        description = None
+        if describe or with_history:
+            # keep only informative parts in filename
+            # sub SAFE path
+            minifile = re.sub('.*SAFE/', '', xml_file)
+            minifile = re.sub(r'-.*\.xml', '.xml', minifile)
+            if isinstance(mappings, dict):
+                xpaths = [xpath for _, xpath in mappings.values()]
+            else:
+                xpaths = [xpath for _, xpath in mappings]
+                if isinstance(args, tuple):
+                    xpaths = tuple(xpaths)
+            description = yaml.safe_dump({var_name: {minifile: xpaths}})
+            if describe:
+                return description
+
+        result = None
+        if isinstance(mappings, dict):
+            result = {key: self._eval_mapping(xml_file, *mapping) for key, mapping in mappings.items()}
+        elif mappings is not None:
+            result = [self._eval_mapping(xml_file, *mapping) for mapping in mappings]
 
         if isinstance(args, tuple):
             result = tuple(result)
 
-        if func is not None and not describe:
+        if func is not None:
             # apply converter
             result = func(*result)
 
-        if describe:
-            if isinstance(result, dict):
-                result = result.values()
-            description = yaml.safe_dump({var_name: {minifile: result}})
-            return description
-        else:
-            return result
+        if with_history:
+            return result, description
+        return result
 
     def __del__(self):
         logger.debug('__del__ XmlParser')
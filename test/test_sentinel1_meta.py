@@ -0,0 +1,86 @@
+import numpy as np
+from scipy.interpolate import RectBivariateSpline
+from xsar import Sentinel1Meta
+from xsar.sentinel1_meta import _compute_burst_indices
+
+
+def _meta_without_safe():
+    # Sentinel1Meta instance with only the rasters attributes set by __init__ (no SAFE needed)
+    meta = Sentinel1Meta.__new__(Sentinel1Meta)
+    meta.rasters = Sentinel1Meta.rasters
+    meta._rasters_owned = False
+    return meta
+
+
+def test_set_raster_copy_on_write(monkeypatch):
+    # class rasters are restored after the test
+    monkeypatch.setattr(Sentinel1Meta, 'rasters', Sentinel1Meta.rasters)
+
+    a = _meta_without_safe()
+    b = _meta_without_safe()
+    Sentinel1Meta.set_raster('ecmwf_0100_1h', '/path/to/ecmwf')
+    # existing instances don't see class level changes
+    assert a.rasters.empty and b.rasters.empty
+
+    a.set_raster('gebco', '/path/to/gebco')
+    assert list(a.rasters.index) == ['gebco']
+    # instances created before the class change share the same dataframe: it must not be modified
+    assert b.rasters.empty
+    assert list(Sentinel1Meta.rasters.index) == ['ecmwf_0100_1h']
+
+    c = _meta_without_safe()
+    c.set_raster('gebco', '/path/to/gebco')
+    assert list(c.rasters.index) == ['ecmwf_0100_1h', 'gebco']
+    assert list(Sentinel1Meta.rasters.index) == ['ecmwf_0100_1h']
+
+
+def _burst_indices_searchsorted(geoloc_line, shape_atrack, burst_nlines):
+    # reference implementation, with a searchsorted over all atracks
+    geoloc_iburst = np.floor(geoloc_line / float(burst_nlines)).astype('int32')
+    iburst = np.floor(np.arange(0, shape_atrack) / float(burst_nlines)).astype('int32')
+    ind = np.searchsorted(geoloc_iburst, iburst, side='left')
+    ind[ind >= len(geoloc_line)] = len(geoloc_line) - 1
+    return ind, geoloc_iburst
+
+
+def test_compute_burst_indices():
+    rng = np.random.default_rng(0)
+    for _ in range(2000):
+        shape_atrack = int(rng.integers(1, 30000))
+        burst_nlines = int(rng.integers(1, 3000))
+        size = int(rng.integers(2, 30))
+        geoloc_line = np.unique(np.r_[0, rng.integers(0, int(shape_atrack * 1.2) + 1, size)])
+        ind, geoloc_iburst = _compute_burst_indices(geoloc_line, shape_atrack, burst_nlines)
+        ind_ref, geoloc_iburst_ref = _burst_indices_searchsorted(geoloc_line, shape_atrack, burst_nlines)
+        np.testing.assert_array_equal(ind, ind_ref)
+        np.testing.assert_array_equal(geoloc_iburst, geoloc_iburst_ref)
+
+
+def test_interp_geoloc():
+    rng = np.random.default_rng(0)
+    idx_atrack = np.unique(rng.integers(0, 16000, 12))
+    idx_xtrack = np.unique(rng.integers(0, 25000, 21))
+    values = {
+        'longitude': rng.uniform(-180, 180, (idx_atrack.size, idx_xtrack.size)),
+        'latitude': rng.uniform(-90, 90, (idx_atrack.size, idx_xtrack.size))
+    }
+    grid = (idx_atrack, idx_xtrack, values)
+    splines = [RectBivariateSpline(idx_atrack, idx_xtrack, v, kx=1, ky=1) for v in values.values()]
+
+    # out of grid coordinates are clipped (like RectBivariateSpline)
+    atracks = rng.uniform(-500, 16500, 1000)
+    xtracks = rng.uniform(-500, 25500, 1000)
+    for res, spline in zip(Sentinel1Meta._interp_geoloc(grid, atracks, xtracks), splines):
+        np.testing.assert_allclose(res, spline.ev(atracks, xtracks), rtol=0, atol=1e-9)
+
+    # to_grid
+    atracks = np.sort(atracks[:50])
+    xtracks = np.sort(xtracks[:70])
+    for res, spline in zip(Sentinel1Meta._interp_geoloc(grid, atracks, xtracks, to_grid=True), splines):
+        assert res.shape == (50, 70)
+        np.testing.assert_allclose(res, spline(atracks, xtracks), rtol=0, atol=1e-9)
+
+    # scalars
+    for res, spline in zip(Sentinel1Meta._interp_geoloc(grid, 1234.5, 6789.), splines):
+        assert res.shape == ()
+        np.testing.assert_allclose(res, spline.ev(1234.5, 6789.), rtol=0, atol=1e-9)
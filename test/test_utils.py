@@ -0,0 +1,24 @@
+import numpy as np
+from xsar.utils import haversine, bearing
+
+
+def test_bearing():
+    # cardinal directions from (0, 0)
+    np.testing.assert_allclose(bearing(0, 0, 0, 1), 0, atol=1e-9)
+    np.testing.assert_allclose(bearing(0, 0, 1, 0), 90, atol=1e-9)
+    np.testing.assert_allclose(bearing(0, 0, 0, -1), 180, atol=1e-9)
+    np.testing.assert_allclose(bearing(0, 0, -1, 0), -90, atol=1e-9)
+
+    # same as haversine bearing, on arrays
+    rng = np.random.default_rng(0)
+    lon1, lon2 = rng.uniform(-180, 180, (2, 1000))
+    lat1, lat2 = rng.uniform(-89, 89, (2, 1000))
+    _, heading = haversine(lon1, lat1, lon2, lat2)
+    np.testing.assert_allclose(bearing(lon1, lat1, lon2, lat2), heading, rtol=0, atol=1e-9)
+
+
+def test_haversine():
+    # 1 degree along the equator
+    distance, heading = haversine(0, 0, 1, 0)
+    np.testing.assert_allclose(distance, 6371000 * np.pi / 180)
+    np.testing.assert_allclose(heading, 90)
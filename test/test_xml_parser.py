@@ -0,0 +1,51 @@
+import yaml
+from xsar.xml_parser import XmlParser
+
+
+def scalar(x):
+    return x[0]
+
+
+xpath_mappings = {
+    'annotation': {
+        'a': (scalar, '/product/a'),
+        'b': (scalar, '/product/b'),
+        'c': '/product/c',
+    }
+}
+
+compounds_vars = {
+    'sum': {
+        'func': lambda a, b: a + b,
+        'args': ('annotation.a', 'annotation.b')
+    },
+    'dict_var': {
+        'first': 'annotation.a',
+        'third': 'annotation.c'
+    },
+    'list_var': ['annotation.b', 'annotation.c'],
+}
+
+
+def _xml_file(tmp_path):
+    xml_dir = tmp_path / 'S1A_TEST.SAFE' / 'annotation'
+    xml_dir.mkdir(parents=True)
+    xml_file = xml_dir / 's1a-iw1-slc-vv-20170907t102951-001.xml'
+    xml_file.write_text('<product><a>1</a><b>2</b><c>x</c></product>')
+    return str(xml_file)
+
+
+def test_get_compound_var(tmp_path):
+    xml_file = _xml_file(tmp_path)
+    xml_parser = XmlParser(xpath_mappings=xpath_mappings, compounds_vars=compounds_vars)
+
+    expected = {
+        'sum': (3, ('/product/a', '/product/b')),
+        'dict_var': ({'first': 1, 'third': ['x']}, ['/product/a', '/product/c']),
+        'list_var': ([2, ['x']], ['/product/b', '/product/c']),
+    }
+    for var_name, (value, xpaths) in expected.items():
+        description = yaml.safe_dump({var_name: {'annotation/s1a.xml': xpaths}})
+        assert xml_parser.get_compound_var(xml_file, var_name) == value
+        assert xml_parser.get_compound_var(xml_file, var_name, describe=True) == description
+        assert xml_parser.get_compound_var(xml_file, var_name, with_history=True) == (value, description)